@@ -4,13 +4,21 @@ Task Manager API - Flask Backend
 Production-ready REST API for task management
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, g, request, Response
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.orm import raiseload
+from sqlalchemy.pool import QueuePool
 from datetime import datetime
+from functools import wraps
 import os
+import atexit
+import queue
+import sys
 import logging
-from logging.handlers import RotatingFileHandler
+import orjson
+from logging.handlers import QueueHandler, QueueListener
 
 # Try to import Flask-Talisman for security headers, skip if not installed
 try:
@@ -19,6 +27,20 @@ try:
 except ImportError:
     TALISMAN_AVAILABLE = False
 
+# Try to import Flask-Compress for response compression, skip if not installed
+try:
+    from flask_compress import Compress  # type: ignore
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+# Try to import ciso8601 for fast C-level ISO 8601 parsing, fall back to stdlib if not installed
+try:
+    import ciso8601  # type: ignore
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
 # Initialize Flask app
 app = Flask(__name__)
 
@@ -40,42 +62,112 @@ if TALISMAN_AVAILABLE:
     )
 
 # Configuration
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///tasks.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URI', 'sqlite:///tasks.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Keep a pool of warm SQLite connections shared across request threads
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'poolclass': QueuePool,
+    'connect_args': {'check_same_thread': False, 'timeout': 30},
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_pre_ping': True
+}
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', os.urandom(32).hex())
-app.config['JSON_SORT_KEYS'] = False
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max request size
 app.config['SESSION_COOKIE_SECURE'] = True
 app.config['SESSION_COOKIE_HTTPONLY'] = True
 app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
 app.config['PREFERRED_URL_SCHEME'] = 'https'
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_MIN_SIZE'] = 500
+
+# Compress JSON responses above COMPRESS_MIN_SIZE (if available)
+if COMPRESS_AVAILABLE:
+    Compress(app)
 
 # Initialize database
 db = SQLAlchemy(app)
 
+# SQLite tuning: WAL journal avoids fsyncing the main DB file on every commit
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=268435456',
+)
+
+with app.app_context():
+    @event.listens_for(db.engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply SQLite pragmas to every new connection"""
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+# JSON responses are encoded with orjson (handles datetime natively)
+def jsonify(obj, status=200):
+    """Serialize obj with orjson and wrap it in a JSON response"""
+    return Response(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), status=status, mimetype='application/json')
+
 # Configure logging
 if not app.debug:
-    if not os.path.exists('logs'):
-        os.mkdir('logs')
-    file_handler = RotatingFileHandler('logs/taskmanager.log', maxBytes=10240, backupCount=10)
-    file_handler.setFormatter(logging.Formatter(
+    # Log to stderr (captured by journald via the systemd unit). Gunicorn workers
+    # can't safely share one RotatingFileHandler: concurrent rollovers clobber files
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(
         '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
     ))
-    file_handler.setLevel(logging.INFO)
-    app.logger.addHandler(file_handler)
+    stream_handler.setLevel(logging.INFO)
+    # Request threads only enqueue records; a background listener does the IO
+    log_queue = queue.SimpleQueue()
+    app.logger.addHandler(QueueHandler(log_queue))
     app.logger.setLevel(logging.INFO)
+
+    def start_log_listener():
+        """Start a listener thread draining log_queue into the stream handler"""
+        global log_listener
+        log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        log_listener.start()
+
+    start_log_listener()
+    # Threads don't survive fork, so each gunicorn worker starts its own listener
+    os.register_at_fork(after_in_child=start_log_listener)
+    atexit.register(lambda: log_listener.stop())
     app.logger.info('Task Manager API startup')
 
+def _parse_iso(value):
+    """Parse an ISO 8601 date/datetime string, raising ValueError if invalid"""
+    if CISO8601_AVAILABLE:
+        return ciso8601.parse_datetime(value)
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+# Pagination limits for task listing when a client asks for pages
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
 # Database Models
 class Task(db.Model):
     """Task model for database"""
+    # Indexes match the filter/order pattern used by get_tasks
+    __table_args__ = (
+        db.Index('ix_tasks_filter', 'completed', 'category', 'priority', 'created_at'),
+        db.Index('ix_tasks_created', 'created_at'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
     description = db.Column(db.Text)
-    completed = db.Column(db.Boolean, default=False)
-    priority = db.Column(db.String(20), default='medium')  # low, medium, high
-    category = db.Column(db.String(50), default='general')
+    completed = db.Column(db.Boolean, default=False)  # leading column of ix_tasks_filter
+    priority = db.Column(db.String(20), default='medium', index=True)  # low, medium, high
+    category = db.Column(db.String(50), default='general', index=True)
     due_date = db.Column(db.DateTime)
+    # Python-side microsecond timestamps: SQLite's CURRENT_TIMESTAMP only has
+    # second precision and a text format that breaks the keyset cursor comparison
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -88,11 +180,24 @@ class Task(db.Model):
             'completed': self.completed,
             'priority': self.priority,
             'category': self.category,
-            'due_date': self.due_date.isoformat() if self.due_date else None,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'due_date': self.due_date,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
+# Columns clients may request from the task list via ?fields=
+TASK_COLUMNS = {
+    'id': Task.id,
+    'title': Task.title,
+    'description': Task.description,
+    'completed': Task.completed,
+    'priority': Task.priority,
+    'category': Task.category,
+    'due_date': Task.due_date,
+    'created_at': Task.created_at,
+    'updated_at': Task.updated_at
+}
+
 class Category(db.Model):
     """Category model for task organization"""
     id = db.Column(db.Integer, primary_key=True)
@@ -105,55 +210,161 @@ class Category(db.Model):
             'id': self.id,
             'name': self.name,
             'color': self.color,
-            'created_at': self.created_at.isoformat()
+            'created_at': self.created_at
         }
 
+# SQLite FTS5 shadow table for task search (external content on the task table).
+# The trigram tokenizer keeps the substring semantics of the old LIKE search.
+TASKS_FTS_SCHEMA = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts
+       USING fts5(title, description, content='task', content_rowid='id', tokenize='trigram')""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON task BEGIN
+         INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON task BEGIN
+         INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+       END""",
+    # Only reindex when searchable text changes, not on completed/priority/category edits;
+    # dropped first so databases with the older catch-all trigger pick this one up
+    "DROP TRIGGER IF EXISTS tasks_fts_au",
+    """CREATE TRIGGER tasks_fts_au AFTER UPDATE OF title, description ON task BEGIN
+         INSERT INTO tasks_fts(tasks_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+         INSERT INTO tasks_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+       END""",
+)
+
+# Write counter for conditional GETs on tasks; bumped inside each writing
+# transaction, so it only ever increases regardless of commit order
+TASK_VERSION_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS task_version (
+         id INTEGER PRIMARY KEY CHECK (id = 1),
+         version INTEGER NOT NULL
+       )""",
+    "INSERT OR IGNORE INTO task_version (id, version) VALUES (1, 0)",
+    """CREATE TRIGGER IF NOT EXISTS task_version_ai AFTER INSERT ON task BEGIN
+         UPDATE task_version SET version = version + 1 WHERE id = 1;
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS task_version_au AFTER UPDATE ON task BEGIN
+         UPDATE task_version SET version = version + 1 WHERE id = 1;
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS task_version_ad AFTER DELETE ON task BEGIN
+         UPDATE task_version SET version = version + 1 WHERE id = 1;
+       END""",
+)
+
 # Create tables
 with app.app_context():
     db.create_all()
+    # create_all skips existing tables, so add any indexes missing from older databases
+    for index in Task.__table__.indexes:
+        index.create(db.engine, checkfirst=True)
+    # Redundant with ix_tasks_filter, which already leads with completed
+    db.session.execute(db.text('DROP INDEX IF EXISTS ix_task_completed'))
+    # Full-text search index over task title/description, kept in sync by triggers
+    fts_sql = db.session.execute(
+        db.text("SELECT sql FROM sqlite_master WHERE type='table' AND name='tasks_fts'")
+    ).scalar()
+    # Recreate indexes built with the earlier word tokenizer
+    if fts_sql and 'trigram' not in fts_sql:
+        db.session.execute(db.text('DROP TABLE tasks_fts'))
+        fts_sql = None
+    for statement in TASKS_FTS_SCHEMA:
+        db.session.execute(db.text(statement))
+    if not fts_sql:
+        db.session.execute(db.text("INSERT INTO tasks_fts(tasks_fts) VALUES('rebuild')"))
+    for statement in TASK_VERSION_SCHEMA:
+        db.session.execute(db.text(statement))
+    db.session.commit()
     # Add default categories if none exist
     if Category.query.count() == 0:
         default_categories = [
-            Category(name='Work', color='#3B82F6'),
-            Category(name='Personal', color='#10B981'),
-            Category(name='Shopping', color='#F59E0B'),
-            Category(name='Health', color='#EF4444'),
-            Category(name='General', color='#6B7280')
+            {'name': 'Work', 'color': '#3B82F6'},
+            {'name': 'Personal', 'color': '#10B981'},
+            {'name': 'Shopping', 'color': '#F59E0B'},
+            {'name': 'Health', 'color': '#EF4444'},
+            {'name': 'General', 'color': '#6B7280'}
         ]
-        db.session.add_all(default_categories)
+        # Single multi-row INSERT instead of per-object flushes
+        db.session.execute(db.insert(Category), default_categories)
         db.session.commit()
+    # Gunicorn preloads the app before forking; drop startup connections so
+    # each worker opens its own SQLite handles
+    db.session.remove()
+    db.engine.dispose()
+
+# Conditional GET support: weak ETags derived from cheap queries
+def tasks_etag():
+    """ETag that changes whenever a task is created, updated or deleted"""
+    version = db.session.execute(db.text('SELECT version FROM task_version WHERE id = 1')).scalar()
+    return f'v{version or 0}'
+
+def categories_etag():
+    """ETag that changes whenever a category is created"""
+    last_id, count = db.session.execute(
+        db.select(db.func.max(Category.id), db.func.count(Category.id))
+    ).one()
+    return f'{last_id or 0}-{count}'
+
+def etag_matches(etag):
+    """Check If-None-Match, ignoring the ':gzip'/':br' suffix Flask-Compress appends"""
+    if_none_match = request.if_none_match
+    if if_none_match.star_tag:
+        return True
+    return any(tag.split(':', 1)[0] == etag for tag in if_none_match.as_set(include_weak=True))
+
+def conditional(etag_func):
+    """Answer 304 when the client's If-None-Match still matches, else tag the response"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = g.etag = etag_func()
+            if etag_matches(etag):
+                response = Response(status=304)
+                response.set_etag(etag, weak=True)
+                return response
+            response = view(*args, **kwargs)
+            if response.status_code == 200:
+                response.set_etag(etag, weak=True)
+            return response
+        return wrapper
+    return decorator
 
 # API Routes
 
+# Constant payloads are serialized once; only the health timestamp varies per request
+INDEX_BYTES = orjson.dumps({
+    'name': 'Task Manager API',
+    'version': '1.0.0',
+    'status': 'running',
+    'endpoints': {
+        'tasks': '/api/tasks',
+        'categories': '/api/categories',
+        'health': '/api/health',
+        'stats': '/api/stats'
+    }
+})
+HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+HEALTH_SUFFIX = b'","database":"connected"}'
+
 @app.route('/')
 def index():
     """API information endpoint"""
-    return jsonify({
-        'name': 'Task Manager API',
-        'version': '1.0.0',
-        'status': 'running',
-        'endpoints': {
-            'tasks': '/api/tasks',
-            'categories': '/api/categories',
-            'health': '/api/health',
-            'stats': '/api/stats'
-        }
-    })
+    return Response(INDEX_BYTES, mimetype='application/json')
 
 @app.route('/api/health')
 def health():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.utcnow().isoformat(),
-        'database': 'connected'
-    })
+    now = datetime.utcnow().isoformat().encode()
+    return Response(HEALTH_PREFIX + now + HEALTH_SUFFIX, mimetype='application/json')
 
 @app.route('/api/stats')
+@conditional(tasks_etag)
 def stats():
     """Get task statistics"""
-    total = Task.query.count()
-    completed = Task.query.filter_by(completed=True).count()
+    total, completed = db.session.execute(db.select(
+        db.func.count(Task.id),
+        db.func.coalesce(db.func.sum(db.cast(Task.completed, db.Integer)), 0)
+    )).one()
     pending = total - completed
 
     return jsonify({
@@ -166,6 +377,7 @@ def stats():
 # Task CRUD Operations
 
 @app.route('/api/tasks', methods=['GET'])
+@conditional(tasks_etag)
 def get_tasks():
     """Get all tasks with optional filtering"""
     try:
@@ -175,28 +387,77 @@ def get_tasks():
         completed = request.args.get('completed')
         search = request.args.get('search')
 
-        query = Task.query
+        # Column projection; id and created_at are always selected for the cursor
+        fields = list(dict.fromkeys(f for f in request.args.get('fields', '').split(',') if f in TASK_COLUMNS)) or list(TASK_COLUMNS)
+        selected = list(dict.fromkeys(fields + ['id', 'created_at']))
+
+        # Keyset pagination is opt-in via limit/cursor; cursor is '<created_at>|<id>'
+        # of the last task on the previous page
+        cursor = request.args.get('cursor')
+        limit = None
+        if 'limit' in request.args or cursor:
+            try:
+                limit = min(int(request.args.get('limit', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+                if limit < 1:
+                    raise ValueError
+            except ValueError:
+                return jsonify({'success': False, 'error': 'Invalid limit'}, 400)
+
+        cursor_filter = None
+        if cursor:
+            try:
+                cursor_ts, cursor_id = cursor.rsplit('|', 1)
+                cursor_dt = _parse_iso(cursor_ts)
+                cursor_id = int(cursor_id)
+            except ValueError:
+                return jsonify({'success': False, 'error': 'Invalid cursor'}, 400)
+            cursor_filter = (Task.created_at < cursor_dt) | ((Task.created_at == cursor_dt) & (Task.id < cursor_id))
+
+        query = db.select(*(TASK_COLUMNS[f] for f in selected))
 
         if category:
-            query = query.filter_by(category=category)
+            query = query.where(Task.category == category)
         if priority:
-            query = query.filter_by(priority=priority)
+            query = query.where(Task.priority == priority)
         if completed is not None:
             completed_bool = completed.lower() == 'true'
-            query = query.filter_by(completed=completed_bool)
+            query = query.where(Task.completed == completed_bool)
         if search:
-            query = query.filter(Task.title.contains(search) | Task.description.contains(search))
-
-        tasks = query.order_by(Task.created_at.desc()).all()
+            if len(search) >= 3:
+                # Quote the term as an FTS5 phrase so user input can't inject query syntax
+                fts_query = '"' + search.replace('"', '""') + '"'
+                matches = db.text('SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH :q').bindparams(q=fts_query)
+                query = query.where(Task.id.in_(matches.columns(db.column('rowid', db.Integer))))
+            else:
+                # Trigrams need at least three characters; short terms use a plain scan
+                query = query.where(Task.title.contains(search) | Task.description.contains(search))
+
+        if cursor_filter is not None:
+            query = query.where(cursor_filter)
+
+        query = query.order_by(Task.created_at.desc(), Task.id.desc())
+        if limit is not None:
+            # Fetch one extra row to know whether another page exists
+            query = query.limit(limit + 1)
+        rows = db.session.execute(query).all()
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = f'{rows[-1].created_at.isoformat()}|{rows[-1].id}'
+
+        # Requested fields lead the selected columns, so zip maps them positionally;
+        # plain dicts (not RowMapping) are what orjson serializes natively
+        tasks = [dict(zip(fields, row)) for row in rows]
 
         return jsonify({
             'success': True,
             'count': len(tasks),
-            'tasks': [task.to_dict() for task in tasks]
+            'tasks': tasks,
+            'next_cursor': next_cursor
         })
     except Exception as e:
         app.logger.error(f'Error fetching tasks: {str(e)}')
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return jsonify({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/tasks/<int:task_id>', methods=['GET'])
 def get_task(task_id):
@@ -215,15 +476,15 @@ def create_task():
 
         # Validation
         if not data or not data.get('title'):
-            return jsonify({'success': False, 'error': 'Title is required'}), 400
+            return jsonify({'success': False, 'error': 'Title is required'}, 400)
 
         # Parse due date if provided
         due_date = None
         if data.get('due_date'):
             try:
-                due_date = datetime.fromisoformat(data['due_date'].replace('Z', '+00:00'))
+                due_date = _parse_iso(data['due_date'])
             except ValueError:
-                return jsonify({'success': False, 'error': 'Invalid date format'}), 400
+                return jsonify({'success': False, 'error': 'Invalid date format'}, 400)
 
         task = Task(
             title=data['title'],
@@ -242,38 +503,29 @@ def create_task():
             'success': True,
             'message': 'Task created successfully',
             'task': task.to_dict()
-        }), 201
+        }, 201)
     except Exception as e:
         db.session.rollback()
         app.logger.error(f'Error creating task: {str(e)}')
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return jsonify({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/tasks/<int:task_id>', methods=['PUT'])
 def update_task(task_id):
     """Update an existing task"""
     try:
-        task = Task.query.get_or_404(task_id)
         data = request.get_json()
 
-        if 'title' in data:
-            task.title = data['title']
-        if 'description' in data:
-            task.description = data['description']
-        if 'completed' in data:
-            task.completed = data['completed']
-        if 'priority' in data:
-            task.priority = data['priority']
-        if 'category' in data:
-            task.category = data['category']
+        # Only columns present in the payload are written, in one UPDATE statement
+        values = {key: data[key] for key in ('title', 'description', 'completed', 'priority', 'category') if key in data}
         if 'due_date' in data:
-            if data['due_date']:
-                task.due_date = datetime.fromisoformat(data['due_date'].replace('Z', '+00:00'))
-            else:
-                task.due_date = None
+            values['due_date'] = _parse_iso(data['due_date']) if data['due_date'] else None
 
-        task.updated_at = datetime.utcnow()
+        updated = Task.query.filter_by(id=task_id).update(values, synchronize_session=False)
+        if not updated:
+            return jsonify({'success': False, 'error': 'Resource not found'}, 404)
         db.session.commit()
 
+        task = db.session.get(Task, task_id)
         app.logger.info(f'Task updated: {task.title}')
 
         return jsonify({
@@ -284,17 +536,21 @@ def update_task(task_id):
     except Exception as e:
         db.session.rollback()
         app.logger.error(f'Error updating task: {str(e)}')
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return jsonify({'success': False, 'error': str(e)}, 500)
 
 @app.route('/api/tasks/<int:task_id>', methods=['DELETE'])
 def delete_task(task_id):
     """Delete a task"""
     try:
-        task = Task.query.get_or_404(task_id)
-        db.session.delete(task)
+        # DELETE ... RETURNING (SQLite >= 3.35) avoids a separate SELECT
+        title = db.session.execute(
+            db.delete(Task).where(Task.id == task_id).returning(Task.title)
+        ).scalar()
+        if title is None:
+            return jsonify({'success': False, 'error': 'Resource not found'}, 404)
         db.session.commit()
 
-        app.logger.info(f'Task deleted: {task.title}')
+        app.logger.info(f'Task deleted: {title}')
 
         return jsonify({
             'success': True,
@@ -303,18 +559,26 @@ def delete_task(task_id):
     except Exception as e:
         db.session.rollback()
         app.logger.error(f'Error deleting task: {str(e)}')
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return jsonify({'success': False, 'error': str(e)}, 500)
 
 # Category Routes
 
+# Serialized category list, reused until a create in this process clears it or
+# the ETag shows another worker changed the table
+_categories_cache = {'etag': None, 'bytes': None}
+
 @app.route('/api/categories', methods=['GET'])
+@conditional(categories_etag)
 def get_categories():
     """Get all categories"""
-    categories = Category.query.all()
-    return jsonify({
-        'success': True,
-        'categories': [cat.to_dict() for cat in categories]
-    })
+    if _categories_cache['bytes'] is None or _categories_cache['etag'] != g.etag:
+        # raiseload turns any accidental lazy relationship load into an error instead of an N+1
+        categories = Category.query.options(raiseload('*')).all()
+        _categories_cache.update(etag=g.etag, bytes=orjson.dumps({
+            'success': True,
+            'categories': [cat.to_dict() for cat in categories]
+        }))
+    return Response(_categories_cache['bytes'], mimetype='application/json')
 
 @app.route('/api/categories', methods=['POST'])
 def create_category():
@@ -323,7 +587,7 @@ def create_category():
         data = request.get_json()
 
         if not data or not data.get('name'):
-            return jsonify({'success': False, 'error': 'Name is required'}), 400
+            return jsonify({'success': False, 'error': 'Name is required'}, 400)
 
         category = Category(
             name=data['name'],
@@ -332,25 +596,27 @@ def create_category():
 
         db.session.add(category)
         db.session.commit()
+        _categories_cache['bytes'] = None
 
         return jsonify({
             'success': True,
             'category': category.to_dict()
-        }), 201
+        }, 201)
     except Exception as e:
         db.session.rollback()
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return jsonify({'success': False, 'error': str(e)}, 500)
 
 # Error handlers
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({'success': False, 'error': 'Resource not found'}), 404
+    return jsonify({'success': False, 'error': 'Resource not found'}, 404)
 
 @app.errorhandler(500)
 def internal_error(error):
     db.session.rollback()
-    return jsonify({'success': False, 'error': 'Internal server error'}), 500
+    return jsonify({'success': False, 'error': 'Internal server error'}, 500)
 
+# Development server only; production runs under gunicorn (see backend.service.j2)
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=False)
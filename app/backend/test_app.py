@@ -0,0 +1,171 @@
+"""
+Task Manager API - tests
+Run from app/backend with: python -m pytest -q
+"""
+
+import importlib
+import sqlite3
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """Fresh app module bound to a temporary SQLite database"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('DATABASE_URI', f'sqlite:///{tmp_path / "tasks.db"}')
+    monkeypatch.setenv('FORCE_HTTPS', 'False')
+    sys.modules.pop('app', None)
+    app_module = importlib.import_module('app')
+    app_module.app.config['TESTING'] = True
+    yield app_module.app.test_client()
+    with app_module.app.app_context():
+        app_module.db.session.remove()
+        app_module.db.engine.dispose()
+
+
+def create_tasks(client, count):
+    """Create count tasks and return their ids in creation order"""
+    ids = []
+    for i in range(count):
+        response = client.post('/api/tasks', json={'title': f'Task {i}'})
+        assert response.status_code == 201
+        ids.append(response.get_json()['task']['id'])
+    return ids
+
+
+def test_cursor_pages_through_all_tasks(client):
+    ids = create_tasks(client, 5)
+
+    pages = []
+    params = {'limit': 2}
+    while True:
+        data = client.get('/api/tasks', query_string=params).get_json()
+        pages.append([task['id'] for task in data['tasks']])
+        if data['next_cursor'] is None:
+            break
+        params['cursor'] = data['next_cursor']
+        assert len(pages) <= 5, 'cursor did not advance'
+
+    assert pages == [ids[4:2:-1], ids[2:0:-1], ids[:1]]
+
+
+def test_stats_etag_changes_after_update(client):
+    (task_id,) = create_tasks(client, 1)
+    first = client.get('/api/stats')
+    assert first.get_json()['completed_tasks'] == 0
+
+    client.put(f'/api/tasks/{task_id}', json={'completed': True})
+
+    second = client.get('/api/stats', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert second.get_json()['completed_tasks'] == 1
+    assert second.headers['ETag'] != first.headers['ETag']
+
+
+def test_stats_reflect_writes_from_other_processes(client, tmp_path):
+    create_tasks(client, 1)
+    first = client.get('/api/stats')
+    assert first.get_json()['total_tasks'] == 1
+
+    # Simulate another gunicorn worker writing to the shared database
+    with sqlite3.connect(tmp_path / 'tasks.db') as conn:
+        conn.execute(
+            "INSERT INTO task (title, completed, created_at, updated_at) "
+            "VALUES ('Other worker', 0, '2030-01-01 00:00:00.000000', '2030-01-01 00:00:00.000000')"
+        )
+
+    second = client.get('/api/stats', headers={'If-None-Match': first.headers['ETag']})
+    assert second.status_code == 200
+    assert second.get_json()['total_tasks'] == 2
+
+
+def test_compressed_etag_revalidates(client):
+    create_tasks(client, 20)
+    first = client.get('/api/tasks', headers={'Accept-Encoding': 'gzip'})
+    assert first.status_code == 200
+
+    second = client.get('/api/tasks', headers={
+        'Accept-Encoding': 'gzip',
+        'If-None-Match': first.headers['ETag'],
+    })
+    assert second.status_code == 304
+
+
+def test_task_list_is_unpaginated_by_default(client):
+    ids = create_tasks(client, 60)
+    data = client.get('/api/tasks').get_json()
+    assert data['count'] == 60
+    assert [task['id'] for task in data['tasks']] == ids[::-1]
+    assert data['next_cursor'] is None
+
+
+def test_field_projection_ignores_duplicates(client):
+    create_tasks(client, 1)
+    data = client.get('/api/tasks', query_string={'fields': 'title,title,completed'}).get_json()
+    assert data['tasks'] == [{'title': 'Task 0', 'completed': False}]
+
+
+def test_etag_changes_when_update_is_not_newest(client, tmp_path):
+    older_id, _ = create_tasks(client, 2)
+    first = client.get('/api/tasks')
+
+    # A write committed late with an older timestamp than the current MAX(updated_at)
+    with sqlite3.connect(tmp_path / 'tasks.db') as conn:
+        conn.execute(
+            "UPDATE task SET completed = 1, updated_at = '2000-01-01 00:00:00.000000' WHERE id = ?",
+            (older_id,)
+        )
+
+    for url in ('/api/tasks', '/api/stats'):
+        response = client.get(url, headers={'If-None-Match': first.headers['ETag']})
+        assert response.status_code == 200
+
+
+def search_ids(client, term):
+    """Ids of tasks matching ?search=term"""
+    data = client.get('/api/tasks', query_string={'search': term}).get_json()
+    return sorted(task['id'] for task in data['tasks'])
+
+
+def test_search_index_follows_create_rename_and_delete(client):
+    response = client.post('/api/tasks', json={'title': 'Buy milk', 'description': 'semi-skimmed'})
+    task_id = response.get_json()['task']['id']
+    assert search_ids(client, 'milk') == [task_id]
+    assert search_ids(client, 'skim') == [task_id]
+
+    client.put(f'/api/tasks/{task_id}', json={'title': 'Buy bread'})
+    assert search_ids(client, 'milk') == []
+    assert search_ids(client, 'bread') == [task_id]
+
+    # Non-text edits leave the index entry intact
+    client.put(f'/api/tasks/{task_id}', json={'completed': True})
+    assert search_ids(client, 'bread') == [task_id]
+
+    client.delete(f'/api/tasks/{task_id}')
+    assert search_ids(client, 'bread') == []
+
+
+def test_search_matches_substrings_and_special_characters(client):
+    response = client.post('/api/tasks', json={'title': 'Task "urgent" AND (later)*'})
+    task_id = response.get_json()['task']['id']
+    client.post('/api/tasks', json={'title': 'Groceries'})
+
+    assert search_ids(client, 'ASK') == [task_id]
+    assert search_ids(client, '"urgent"') == [task_id]
+    assert search_ids(client, 'AND (later)*') == [task_id]
+    assert search_ids(client, 'NOT') == []
+    assert search_ids(client, 'Ta') == [task_id]
+
+
+def test_search_index_is_rebuilt_for_existing_tasks(client, tmp_path):
+    (task_id,) = create_tasks(client, 1)
+    with sqlite3.connect(tmp_path / 'tasks.db') as conn:
+        conn.execute('DROP TABLE tasks_fts')
+
+    # Re-importing the app runs the startup migration against the same database
+    sys.modules.pop('app', None)
+    app_module = importlib.import_module('app')
+    rebuilt = app_module.app.test_client()
+    assert search_ids(rebuilt, 'Task 0') == [task_id]